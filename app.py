@@ -1,12 +1,22 @@
 import streamlit as st
 import geopandas as gpd
-import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import shapely
+import pyogrio
+import pyarrow.parquet as pq
+from pyproj import CRS, Transformer
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import contextily as cx
 import matplotlib.patheffects as pe
 import folium
 from streamlit_folium import st_folium
 from adjustText import adjust_text
+from concurrent.futures import ThreadPoolExecutor
 import io
+import json
+import math
 import os
 from PIL import Image
 
@@ -25,39 +35,213 @@ st.set_page_config(layout="wide", page_title="Workforce Solutions Map Generator"
 def clean_geoms(gdf):
     if gdf is None or gdf.empty:
         return gdf
-    gdf = gdf[~gdf.is_empty]
-    gdf = gdf[gdf.geometry.type.isin(['Polygon', 'MultiPolygon'])]
-    return gdf
+    # Polygon = 3, MultiPolygon = 6 (shapely type ids); empty check folded into the same mask
+    type_ids = shapely.get_type_id(gdf.geometry.to_numpy())
+    keep = ((type_ids == 3) | (type_ids == 6)) & ~gdf.is_empty.to_numpy()
+    return gdf[keep]
+
+# --- HELPER: FAST CLIP ---
+def clip_to_mask(gdf, mask_union):
+    # R-tree prefilter against the single mask polygon, then only intersect polygons that cross its edge
+    hits = gdf.iloc[np.sort(gdf.sindex.query(mask_union, predicate='intersects'))]
+
+    inside = hits.within(mask_union)
+    boundary = hits[~inside].copy()
+    boundary['geometry'] = boundary.geometry.intersection(mask_union)
+    return pd.concat([hits[inside], boundary]).sort_index()
+
+# --- HELPER: CENTROID COORDS ---
+TO_4326 = Transformer.from_crs(3857, 4326, always_xy=True)
+
+def centroid_xy(gdf):
+    # One shapely ufunc pass over the raw geometry array, no GeoSeries/index wrapping
+    cents = shapely.centroid(gdf.geometry.to_numpy())
+    return shapely.get_x(cents), shapely.get_y(cents)
+
+# --- HELPER: FAST LABEL DECLUTTER ---
+# Greedy near-O(N) alternative to adjust_text, working on the real rendered text boxes.
+# A grid of label-height cells is only a spatial hash: a candidate position collides when its
+# box actually overlaps a box already placed in any cell it spans. Reserved labels (county names)
+# are placed first and never move. A colliding label tries half-row steps up/down, then sideways;
+# if nothing is free it stays where it was rather than being dropped.
+def grid_snap_labels(ax, texts, reserved=(), max_tries=6, pad=2):
+    if not texts:
+        return
+    ax.apply_aspect()
+    renderer = ax.figure.canvas.get_renderer()
+    # Pad covers the white stroke path effect, which get_window_extent does not include
+    boxes = {t: t.get_window_extent(renderer).padded(pad) for t in list(reserved) + list(texts)}
+    cell = max(boxes[t].height for t in texts)
+    grid = {}
+
+    def spanned(b):
+        return [(c, r)
+                for c in range(math.floor(b.x0 / cell), math.floor(b.x1 / cell) + 1)
+                for r in range(math.floor(b.y0 / cell), math.floor(b.y1 / cell) + 1)]
+
+    def collides(b):
+        return any(b.overlaps(o) for key in spanned(b) for o in grid.get(key, ()))
+
+    def place(b):
+        for key in spanned(b):
+            grid.setdefault(key, []).append(b)
+
+    for t in reserved:
+        place(boxes[t])
+
+    inv = ax.transData.inverted()
+    for t in texts:
+        box = boxes[t]
+        offsets = [(0, 0)]
+        for k in range(1, max_tries + 1):
+            offsets += [(0, k * cell / 2), (0, -k * cell / 2)]
+        for k in (1, 2):
+            offsets += [(k * box.width / 2, 0), (-k * box.width / 2, 0)]
+
+        for dx, dy in offsets:
+            moved = box.translated(dx, dy)
+            if not collides(moved):
+                place(moved)
+                if dx or dy:
+                    px, py = ax.transData.transform(t.get_position())
+                    t.set_position(inv.transform((px + dx, py + dy)))
+                break
+        else:
+            # Keep the label rather than silently losing it (e.g. a county seat)
+            place(box)
+
+# --- HELPER: WEB DISPLAY COPY ---
+# Folium ships every vertex to the browser; the print render keeps full precision
+FOLIUM_SIMPLIFY_M = 200
+
+def simplify_for_web(gdf_3857):
+    return gdf_3857.assign(geometry=gdf_3857.simplify(FOLIUM_SIMPLIFY_M)).to_crs(epsg=4326)
 
 # --- CACHED DATA LOADING ---
-@st.cache_data
+GULF_COAST = "Gulf Coast Region (13 Counties)"
+BRAZORIA = "Brazoria County Specific"
+
+TARGET_COUNTIES = [
+    'Austin', 'Brazoria', 'Chambers', 'Colorado', 'Fort Bend',
+    'Galveston', 'Harris', 'Liberty', 'Matagorda', 'Montgomery',
+    'Walker', 'Waller', 'Wharton'
+]
+
+# CRS and bbox-covering info from the GeoParquet 'geo' metadata, read without loading any rows
+def parquet_geo_info(path):
+    geo = json.loads(pq.read_schema(path).metadata[b'geo'])
+    column = geo['columns'][geo['primary_column']]
+    crs = CRS.from_user_input(column.get('crs', 'OGC:CRS84'))
+    return crs, 'bbox' in column.get('covering', {})
+
+# A parquet copy is stale once any shapefile component (geometry, attributes, CRS) is newer
+def parquet_is_current(parquet_path, shp_path):
+    if not os.path.exists(parquet_path):
+        return False
+    stem = os.path.splitext(shp_path)[0]
+    parts = [f'{stem}.{ext}' for ext in ('shp', 'shx', 'dbf', 'prj')]
+    source_mtimes = [os.path.getmtime(p) for p in parts if os.path.exists(p)]
+    return not source_mtimes or os.path.getmtime(parquet_path) >= max(source_mtimes)
+
+# Prefer the GeoParquet copies written by shrink.py; fall back to the shapefiles,
+# including when a shapefile has been refreshed since its parquet copy was made.
+# within_gdf limits the read to features inside its total bounds. pyogrio and read_parquet
+# push that filter down; for parquet it needs the covering bbox column shrink.py writes,
+# so older files without one are filtered with .cx after the read instead.
+def read_layer(name, columns=None, within_gdf=None):
+    parquet_path = f'{name}.parquet'
+    shp_path = f'{name}.shp'
+    if parquet_is_current(parquet_path, shp_path):
+        parquet_columns = columns and columns + ['geometry']
+        if within_gdf is None:
+            return gpd.read_parquet(parquet_path, columns=parquet_columns)
+
+        crs, has_covering = parquet_geo_info(parquet_path)
+        bbox = tuple(within_gdf.to_crs(crs).total_bounds)
+        if has_covering:
+            return gpd.read_parquet(parquet_path, columns=parquet_columns, bbox=bbox)
+        minx, miny, maxx, maxy = bbox
+        return gpd.read_parquet(parquet_path, columns=parquet_columns).cx[minx:maxx, miny:maxy]
+
+    bbox = None
+    if within_gdf is not None:
+        # pyogrio expects the bbox in the dataset's own CRS
+        bbox = tuple(within_gdf.to_crs(pyogrio.read_info(shp_path)['crs']).total_bounds)
+    return gpd.read_file(shp_path, engine='pyogrio', columns=columns, bbox=bbox)
+
+# cache_resource, not cache_data: every rerun reads city_col from this, and cache_data would
+# unpickle a fresh copy of all three layers each time. Callers must treat the frames as read-only.
+@st.cache_resource
 def load_data():
-    county_path = 'texas_counties.shp'
-    place_path = 'Cities.shp'
-    isd_path = 'tl_2025_48_unsd.shp'
+    gdf_counties = read_layer('texas_counties', columns=['NAME', 'STATEFP'])
+    region_gdf = gdf_counties[
+        (gdf_counties['NAME'].isin(TARGET_COUNTIES)) &
+        (gdf_counties['STATEFP'] == '48')
+    ]
 
-    gdf_counties = gpd.read_file(county_path)
-    gdf_places = gpd.read_file(place_path)
-    gdf_isds = gpd.read_file(isd_path)
+    # Places are only ever shown inside the region, ISDs only inside Brazoria.
+    # The two reads are independent and GDAL releases the GIL, so run them side by side.
+    with ThreadPoolExecutor(2) as ex:
+        places_fut = ex.submit(read_layer, 'Cities', within_gdf=region_gdf)
+        isds_fut = ex.submit(read_layer, 'tl_2025_48_unsd', columns=['NAME'], within_gdf=region_gdf[region_gdf['NAME'] == 'Brazoria'])
+        gdf_places = places_fut.result()
+        gdf_isds = isds_fut.result()
 
-    return gdf_counties, gdf_places, gdf_isds
-
-try:
-    gdf_counties, gdf_places, gdf_isds = load_data()
-    city_col = 'CITY_NM' if 'CITY_NM' in gdf_places.columns else 'NAME'
+    # Project + measure once here so reruns reuse the cached result
+    region_gdf_3857 = region_gdf.to_crs(epsg=3857)
+    gdf_isds_3857 = gdf_isds.to_crs(epsg=3857)
 
     gdf_places = gdf_places.to_crs(epsg=3857)
     gdf_places['area_sq_mi'] = gdf_places.geometry.area * 3.86102e-7
 
-    target_counties = [
-        'Austin', 'Brazoria', 'Chambers', 'Colorado', 'Fort Bend',
-        'Galveston', 'Harris', 'Liberty', 'Matagorda', 'Montgomery',
-        'Walker', 'Waller', 'Wharton'
-    ]
-    region_gdf = gdf_counties[
-        (gdf_counties['NAME'].isin(target_counties)) &
-        (gdf_counties['STATEFP'] == '48')
-    ]
+    return region_gdf_3857, gdf_places, gdf_isds_3857
+
+# --- CACHED REGION PREP ---
+# Keyed on map_type only: sliders and color pickers never re-run the projection/clip work
+@st.cache_data
+def prep_region(map_type):
+    region_gdf_3857, gdf_places, gdf_isds_3857 = load_data()
+
+    if map_type == GULF_COAST:
+        display_gdf_3857 = region_gdf_3857
+    else: # Brazoria
+        display_gdf_3857 = region_gdf_3857[region_gdf_3857['NAME'] == 'Brazoria']
+    display_gdf_4326 = simplify_for_web(display_gdf_3857)
+    region_union_3857 = display_gdf_3857.geometry.union_all()
+
+    if map_type == GULF_COAST:
+        display_isds_3857 = None
+        display_isds_4326 = None
+    else: # Brazoria
+        display_isds_3857 = clean_geoms(clip_to_mask(gdf_isds_3857, region_union_3857))
+        display_isds_3857 = display_isds_3857.assign(label=(
+            display_isds_3857['NAME']
+            .str.replace('Independent School District', 'ISD', regex=False)
+            .str.replace('Consolidated', 'Cons.', regex=False)
+        ))
+        display_isds_4326 = simplify_for_web(display_isds_3857)
+
+    return display_gdf_4326, display_gdf_3857, display_isds_4326, display_isds_3857, region_union_3857
+
+# Area is measured on the unclipped polygon, so small places can be dropped before the clip.
+# min_area_bucket is floored to whole sq mi to keep the cache hit rate high.
+@st.cache_data
+def prep_cities(map_type, min_area_bucket):
+    _, gdf_places, _ = load_data()
+    *_, region_union_3857 = prep_region(map_type)
+
+    candidates = gdf_places[gdf_places['area_sq_mi'] >= min_area_bucket]
+    clipped = clean_geoms(clip_to_mask(candidates, region_union_3857))
+
+    # One centroid pass shared by every consumer: 3857 x/y for print labels, and the same
+    # points reprojected (not the polygons) to lon/lat for the folium markers
+    cent_x, cent_y = centroid_xy(clipped)
+    lon, lat = TO_4326.transform(cent_x, cent_y)
+    return clipped.assign(cent_x=cent_x, cent_y=cent_y, lon=lon, lat=lat)
+
+try:
+    region_gdf_3857, gdf_places, gdf_isds_3857 = load_data()
+    city_col = 'CITY_NM' if 'CITY_NM' in gdf_places.columns else 'NAME'
 
 except Exception as e:
     st.error(f"Error loading shapefiles: {e}")
@@ -65,10 +249,10 @@ except Exception as e:
 
 # --- SIDEBAR CONTROLS ---
 st.sidebar.header("⚙️ Map Settings")
-map_type = st.sidebar.selectbox("Select Map Region", ["Gulf Coast Region (13 Counties)", "Brazoria County Specific"])
+map_type = st.sidebar.selectbox("Select Map Region", [GULF_COAST, BRAZORIA])
 
 st.sidebar.subheader("🧹 Clutter Control")
-min_area = st.sidebar.slider("Hide Cities Smaller Than (Sq Miles)", 0.0, 50.0, 5.0)
+min_area = st.sidebar.slider("Hide Cities Smaller Than (Sq Miles)", 0.0, 50.0, 5.0, step=1.0)
 
 st.sidebar.subheader("🎨 Colors")
 fill_color_hex = st.sidebar.color_picker("Region Fill Color", "#b3cde3")
@@ -76,49 +260,77 @@ outline_color = st.sidebar.color_picker("Outline Color", "#000000")
 text_color = st.sidebar.color_picker("City Label Color", "#8B0000")
 isd_outline_color = st.sidebar.color_picker("ISD Color (Brazoria)", "#000080")
 
-st.sidebar.subheader("📐 Quality")
-export_dpi = st.sidebar.select_slider("Image Resolution (DPI)", options=[150, 300, 450], value=300)
-
-font_size_header = st.sidebar.slider("Title Font Size", 10, 100, 32)
-font_size_labels = st.sidebar.slider("City Label Size", 4, 40, 10)
-fill_opacity = st.sidebar.slider("Fill Opacity", 0.0, 1.0, 0.4)
+fill_opacity = st.sidebar.slider("Fill Opacity", 0.0, 1.0, 0.4, step=0.05)
 
 # --- MAP PREPARATION ---
+display_gdf_4326, display_gdf, display_isds_4326, display_isds, _ = prep_region(map_type)
+min_area_bucket = math.floor(min_area)
+clipped_cities = prep_cities(map_type, min_area_bucket)
 
-if map_type == "Gulf Coast Region (13 Counties)":
-    main_gdf = region_gdf
-    main_gdf_3857 = main_gdf.to_crs(epsg=3857)
-    clipped_cities = clean_geoms(gpd.clip(gdf_places, main_gdf_3857))
-    display_gdf = main_gdf
-    display_isds = None
+if map_type == GULF_COAST:
     title = "Workforce Solutions Gulf Coast Region"
     safe_zoom = 10
-
 else: # Brazoria
-    brazoria_gdf = region_gdf[region_gdf['NAME'] == 'Brazoria']
-    brazoria_3857 = brazoria_gdf.to_crs(epsg=3857)
-
-    isds_3857 = gdf_isds.to_crs(epsg=3857)
-    clipped_isds = clean_geoms(gpd.clip(isds_3857, brazoria_3857))
-    clipped_cities = clean_geoms(gpd.clip(gdf_places, brazoria_3857))
-
-    display_gdf = brazoria_gdf
-    display_isds = clipped_isds
     title = "Brazoria County: City Limits & ISDs"
     safe_zoom = 12
 
 display_cities = clipped_cities[clipped_cities['area_sq_mi'] >= min_area]
 
-# --- TAB 1: INTERACTIVE MAP ---
-tab1, tab2 = st.tabs(["🗺️ Interactive Map", "🖨️ Print Export (PDF/PNG)"])
+# --- CACHED PRINT CANVAS ---
+# The basemap is the slowest part of the print render, so keep one figure per bounds/zoom
+# with the tiles already drawn and only swap the vector/text overlays on each click.
+# Figures are not thread-safe, so each browser session gets its own via st.session_state.
+@st.cache_data
+def get_basemap_image(bounds, zoom):
+    # Stitched tile mosaic in EPSG:3857; outlives the figure cache and skips the tile re-read/warp
+    minx, miny, maxx, maxy = bounds
+    img, ext = cx.bounds2img(minx, miny, maxx, maxy, zoom=zoom, source=cx.providers.CartoDB.PositronNoLabels)
+    return img, ext
+
+def get_base_fig(bounds, zoom):
+    key = f"print_fig_{bounds}_{zoom}"
+    if key in st.session_state:
+        return st.session_state[key]
+
+    fig = Figure(figsize=(24, 24))
+    # Agg canvas gives grid_snap_labels a renderer to measure text extents with
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+
+    # Rasterize background (Z<1) and polygon fills; outlines and labels stay vector
+    ax.set_rasterization_zorder(1)
+
+    img, ext = get_basemap_image(bounds, zoom)
+    ax.imshow(img, extent=ext, zorder=0, interpolation='bilinear')
+    # imshow skips the credit add_basemap used to draw; the tiles require it
+    cx.add_attribution(ax, cx.providers.CartoDB.PositronNoLabels['attribution'])
+
+    minx, miny, maxx, maxy = bounds
+    ax.set_xlim(minx, maxx)
+    ax.set_ylim(miny, maxy)
+    ax.axis('off')
+
+    # Artists present now belong to the basemap and must survive clear_overlays
+    base_artists = set(ax.get_children())
+    st.session_state[key] = (fig, ax, base_artists)
+    return fig, ax, base_artists
+
+def clear_overlays(ax, base_artists):
+    # Remove only what a previous render added on top of the basemap
+    for art in list(ax.collections) + list(ax.texts) + list(ax.patches) + list(ax.lines):
+        if art not in base_artists:
+            art.remove()
 
-with tab1:
+# --- TAB 1: INTERACTIVE MAP ---
+# Each tab is a fragment: widgets inside one tab (map pans, print settings) only rerun that tab
+@st.fragment
+def render_interactive():
     st.subheader(f"Interactive View: {title}")
-    m = folium.Map(location=[29.5, -95.5], zoom_start=8, tiles=None)
+    m = folium.Map(location=[29.5, -95.5], zoom_start=8, tiles=None, prefer_canvas=True)
     folium.TileLayer(tiles="CartoDB positron", name="Light Map", detect_retina=True).add_to(m)
 
     folium.GeoJson(
-        display_gdf.to_crs(epsg=4326),
+        display_gdf_4326,
         style_function=lambda x: {
             'fillColor': fill_color_hex, 'color': outline_color, 'weight': 2, 'fillOpacity': fill_opacity
         },
@@ -127,7 +339,7 @@ with tab1:
 
     if display_isds is not None and not display_isds.empty:
         folium.GeoJson(
-            display_isds.to_crs(epsg=4326),
+            display_isds_4326,
             style_function=lambda x: {
                 'fillColor': 'orange', 'color': isd_outline_color, 'weight': 1, 'dashArray': '5, 5', 'fillOpacity': 0.1
             },
@@ -135,105 +347,133 @@ with tab1:
         ).add_to(m)
 
     if not display_cities.empty:
-        cities_4326 = display_cities.to_crs(epsg=4326)
-        for idx, row in cities_4326.iterrows():
-            if row.geometry and not row.geometry.is_empty:
-                folium.CircleMarker(
-                    location=[row.geometry.centroid.y, row.geometry.centroid.x],
-                    radius=3, color='red', fill=True,
-                    tooltip=f"{row[city_col]} ({row['area_sq_mi']:.1f} sq mi)"
-                ).add_to(m)
+        xs = display_cities['lon'].to_numpy()
+        ys = display_cities['lat'].to_numpy()
+        names = display_cities[city_col].to_numpy()
+        areas = display_cities['area_sq_mi'].to_numpy()
+        # One FeatureCollection -> one Leaflet layer, instead of a folium element per city
+        city_points = {
+            'type': 'FeatureCollection',
+            'features': [
+                {
+                    'type': 'Feature',
+                    'geometry': {'type': 'Point', 'coordinates': [float(x), float(y)]},
+                    'properties': {'name': str(name), 'area': f"{area:.1f} sq mi"},
+                }
+                for x, y, name, area in zip(xs, ys, names, areas)
+            ],
+        }
+        folium.GeoJson(
+            city_points, name="Cities",
+            marker=folium.CircleMarker(radius=3, color='red', fill=True),
+            tooltip=folium.GeoJsonTooltip(fields=['name', 'area'], aliases=['City:', 'Area:'])
+        ).add_to(m)
 
     st_folium(m, width=1000, height=600)
 
 # --- TAB 2: STATIC PRINT ---
-with tab2:
+@st.fragment
+def render_print():
     st.subheader("Generate Print Files")
+
+    # Print-only settings live here rather than in the sidebar so changing them skips the folium render
+    st.markdown("**📐 Quality**")
+    export_dpi = st.select_slider("Image Resolution (DPI)", options=[150, 300, 450], value=300)
+    font_size_header = st.slider("Title Font Size", 10, 100, 32)
+    font_size_labels = st.slider("City Label Size", 4, 40, 10)
+
     st.write(f"Click below to render at **{export_dpi} DPI**.")
     st.caption(f"ℹ️ Map Zoom Level set to **{safe_zoom}** to prevent blank output.")
 
     use_adjust_text = st.checkbox("Auto-Adjust Labels (Prevents Overlap)", value=True)
+    high_quality_labels = st.checkbox("High Quality Label Placement (Physics engine, slower)", value=False)
+    st.caption("Fast placement moves overlapping labels to a nearby free spot, clear of county names. "
+               "In crowded areas a label with no free spot is left in place and may still overlap; "
+               "use High Quality placement or raise the city size filter there.")
 
     if st.button("Generate Map"):
         progress_text = "Starting engine..."
         my_bar = st.progress(0, text=progress_text)
 
         try:
-            # STEP 1: SETUP
-            my_bar.progress(10, text="Setting up canvas...")
-            fig, ax = plt.subplots(figsize=(24, 24))
-
-            # Rasterize background (Z=1), keep Vectors (Z>1)
-            ax.set_rasterization_zorder(1)
-
-            bounds_gdf = display_gdf.to_crs(epsg=3857)
-            minx, miny, maxx, maxy = bounds_gdf.total_bounds
+            # STEP 1 + 2: SETUP CANVAS AND TILES (cached per bounds/zoom)
+            my_bar.progress(10, text=f"Preparing canvas and background tiles (Zoom {safe_zoom})...")
+            bounds_gdf = display_gdf
+            bounds = tuple(bounds_gdf.total_bounds)
+            fig, ax, base_artists = get_base_fig(bounds, safe_zoom)
+            clear_overlays(ax, base_artists)
+
+            minx, miny, maxx, maxy = bounds
             ax.set_xlim(minx, maxx)
             ax.set_ylim(miny, maxy)
 
-            # STEP 2: DOWNLOAD TILES
-            my_bar.progress(25, text=f"Downloading background tiles (Zoom {safe_zoom})...")
-            cx.add_basemap(ax, source=cx.providers.CartoDB.PositronNoLabels, zoom=safe_zoom, zorder=0)
+            # Centroids computed once per layer and reused by the label loops
+            bx_arr, by_arr = centroid_xy(bounds_gdf)
+            cx_arr, cy_arr = display_cities['cent_x'].to_numpy(), display_cities['cent_y'].to_numpy()
+            if display_isds is not None and not display_isds.empty:
+                ix_arr, iy_arr = centroid_xy(display_isds)
 
             # STEP 3: PLOT VECTORS
             my_bar.progress(50, text="Plotting counties and districts...")
 
             # Draw ISDs
+            isd_texts = []
             if display_isds is not None and not display_isds.empty:
-                display_isds.plot(ax=ax, column='NAME', cmap='Set3', alpha=fill_opacity, zorder=2)
+                display_isds.plot(ax=ax, column='NAME', cmap='Set3', alpha=fill_opacity, zorder=2, rasterized=True)
                 display_isds.plot(ax=ax, facecolor='none', edgecolor=isd_outline_color, linestyle='--', linewidth=1.5, zorder=3)
 
-                isd_texts = []
-                for x, y, label in zip(display_isds.geometry.centroid.x, display_isds.geometry.centroid.y, display_isds['NAME']):
-                    clean = label.replace('Independent School District', 'ISD').replace('Consolidated', 'Cons.')
-                    t = ax.text(x, y, clean, fontsize=font_size_labels, color=isd_outline_color, ha='center', weight='bold',
+                for x, y, label in zip(ix_arr, iy_arr, display_isds['label'].to_numpy()):
+                    t = ax.text(x, y, label, fontsize=font_size_labels, color=isd_outline_color, ha='center', weight='bold',
                             zorder=4, path_effects=[pe.withStroke(linewidth=3, foreground="white")])
                     isd_texts.append(t)
 
             # Draw Region
-            if map_type == "Gulf Coast Region (13 Counties)":
-                display_gdf.to_crs(epsg=3857).plot(ax=ax, column='NAME', cmap='Pastel1', alpha=fill_opacity, zorder=2)
+            if map_type == GULF_COAST:
+                display_gdf.plot(ax=ax, column='NAME', cmap='Pastel1', alpha=fill_opacity, zorder=2, rasterized=True)
 
-            display_gdf.to_crs(epsg=3857).plot(ax=ax, facecolor='none', edgecolor=outline_color, linewidth=3, zorder=4)
+            display_gdf.plot(ax=ax, facecolor='none', edgecolor=outline_color, linewidth=3, zorder=4)
 
             # Draw Cities
-            display_cities.plot(ax=ax, facecolor='gray', edgecolor='none', alpha=0.1, zorder=3)
+            display_cities.plot(ax=ax, facecolor='gray', edgecolor='none', alpha=0.1, zorder=3, rasterized=True)
 
             city_texts = []
-            for x, y, label in zip(display_cities.geometry.centroid.x, display_cities.geometry.centroid.y, display_cities[city_col]):
+            for x, y, label in zip(cx_arr, cy_arr, display_cities[city_col].to_numpy()):
                 t = ax.text(x, y, label, fontsize=font_size_labels, color=text_color, ha='center', weight='bold',
                         zorder=5, path_effects=[pe.withStroke(linewidth=2, foreground="white")])
                 city_texts.append(t)
 
-            if map_type == "Gulf Coast Region (13 Counties)":
-                 for x, y, label in zip(bounds_gdf.geometry.centroid.x, bounds_gdf.geometry.centroid.y, bounds_gdf['NAME']):
-                    ax.text(x, y, label.upper(), fontsize=font_size_labels+4, color=outline_color, ha='center', weight='heavy',
+            county_texts = []
+            if map_type == GULF_COAST:
+                 for x, y, label in zip(bx_arr, by_arr, bounds_gdf['NAME'].to_numpy()):
+                    t = ax.text(x, y, label.upper(), fontsize=font_size_labels+4, color=outline_color, ha='center', weight='heavy',
                             zorder=5, path_effects=[pe.withStroke(linewidth=4, foreground="white")])
+                    county_texts.append(t)
 
-            plt.title(title, fontsize=font_size_header)
-            plt.axis('off')
+            ax.set_title(title, fontsize=font_size_header)
 
             # STEP 4: ADJUST TEXT
             if use_adjust_text:
-                my_bar.progress(70, text="Optimizing label placement (Physics engine)...")
-                all_texts = city_texts + (isd_texts if display_isds is not None else [])
-                if all_texts:
-                    adjust_text(
-                        all_texts, ax=ax, expand_points=(1.2, 1.2),
-                        arrowprops=dict(arrowstyle='-', color='gray', alpha=0.5)
-                    )
+                all_texts = city_texts + isd_texts
+                if high_quality_labels:
+                    my_bar.progress(70, text="Optimizing label placement (Physics engine)...")
+                    if all_texts:
+                        adjust_text(
+                            all_texts, ax=ax, expand_points=(1.2, 1.2),
+                            arrowprops=dict(arrowstyle='-', color='gray', alpha=0.5)
+                        )
+                else:
+                    my_bar.progress(70, text="Decluttering labels...")
+                    grid_snap_labels(ax, all_texts, reserved=county_texts)
 
             # STEP 5: SAVE FILES
             my_bar.progress(85, text=f"Saving high-res image ({export_dpi} DPI)...")
 
             img_png = io.BytesIO()
-            plt.savefig(img_png, format='png', dpi=export_dpi, bbox_inches='tight')
+            fig.savefig(img_png, format='png', dpi=export_dpi, bbox_inches='tight')
 
             my_bar.progress(95, text="Generating Vector PDF...")
             img_pdf = io.BytesIO()
-            plt.savefig(img_pdf, format='pdf', dpi=300, bbox_inches='tight')
-
-            plt.close()
+            fig.savefig(img_pdf, format='pdf', dpi=300, bbox_inches='tight')
 
             my_bar.progress(100, text="Complete!")
             st.success("Rendering Complete!")
@@ -250,3 +490,11 @@ with tab2:
         except Exception as e:
             st.error(f"An error occurred: {e}")
             my_bar.empty()
+
+tab1, tab2 = st.tabs(["🗺️ Interactive Map", "🖨️ Print Export (PDF/PNG)"])
+
+with tab1:
+    render_interactive()
+
+with tab2:
+    render_print()
@@ -1,12 +1,25 @@
+import os
 import geopandas as gpd
 
-print("Loading giant US file...")
-gdf = gpd.read_file('tl_2025_us_county.shp')
+# Step 1 (optional): cut Texas out of the national county file, if it has been downloaded
+if os.path.exists('tl_2025_us_county.shp'):
+    print("Loading giant US file...")
+    gdf = gpd.read_file('tl_2025_us_county.shp')
 
-print("Filtering for Texas...")
-# Filter for Texas (State FIPS '48')
-texas_gdf = gdf[gdf['STATEFP'] == '48']
+    print("Filtering for Texas...")
+    # Filter for Texas (State FIPS '48')
+    texas_gdf = gdf[gdf['STATEFP'] == '48']
 
-print("Saving optimized file...")
-texas_gdf.to_file('texas_counties.shp')
-print("Done! Created texas_counties.shp")
+    print("Saving optimized file...")
+    texas_gdf.to_file('texas_counties.shp')
+    print("Done! Created texas_counties.shp")
+else:
+    print("tl_2025_us_county.shp not found, using the existing texas_counties.shp")
+
+# Step 2: GeoParquet copies of the checked-in shapefiles.
+# They load much faster than shapefile and keep column types intact.
+for name in ['texas_counties', 'Cities', 'tl_2025_48_unsd']:
+    print(f"Converting {name}.shp to GeoParquet...")
+    # Covering bbox column lets read_parquet(bbox=...) skip row groups outside the region
+    gpd.read_file(f'{name}.shp').to_parquet(f'{name}.parquet', write_covering_bbox=True)
+print("Done! app.py will pick up the .parquet files automatically")